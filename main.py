@@ -5,83 +5,406 @@
 # uses ML-based Semantic Search when exact SQL lookups fail.
 # ==================================================================================
 
+import functools
+import math
+import os
+import pickle
+import platform
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
 import pdfplumber
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import duckdb
-from neo4j import GraphDatabase
-from transformers import pipeline
-from sentence_transformers import SentenceTransformer, util
+import torch
+import faiss
+from neo4j import AsyncGraphDatabase, AsyncResult, GraphDatabase, Result
+from transformers import AutoTokenizer, pipeline
+from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from sentence_transformers import SentenceTransformer
+from sentence_transformers.models import StaticEmbedding
 import colpali
 
 # ==================================================================================
-# Load ML Models
+# Load ML Models (lazily, once per process, on first use)
 # ==================================================================================
+# Run both models on GPU in FP16 when CUDA is available, otherwise on CPU in FP32
+use_cuda = torch.cuda.is_available()
+device = "cuda" if use_cuda else "cpu"
+
 # Named Entity Recognition (NER) for extracting material names from queries
-ner_pipeline = pipeline("ner", model="dbmdz/bert-large-cased-finetuned-conll03-english")
+NER_MODEL_NAME = "dbmdz/bert-large-cased-finetuned-conll03-english"
+
+
+def _cpu_has_vnni():
+    """True if the CPU advertises VNNI int8 dot products (read from /proc/cpuinfo on Linux)."""
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            flags = cpuinfo.read().split()
+    except OSError:
+        return False  # unknown CPU: assume no VNNI and quantize with reduce_range
+    return "avx512_vnni" in flags or "avx_vnni" in flags
+
+
+def load_quantized_ner(model_dir="ner_onnx_int8"):
+    """Load the NER model as a dynamic-int8 ONNX Runtime pipeline, exporting it on first use."""
+    # Check for the model file itself, so a directory left by a failed export is rebuilt
+    if not os.path.isfile(os.path.join(model_dir, "model_quantized.onnx")):
+        ort_model = ORTModelForTokenClassification.from_pretrained(NER_MODEL_NAME, export=True)
+        if platform.machine() in ("arm64", "aarch64"):
+            qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+        elif _cpu_has_vnni():
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        else:
+            # Without VNNI, u8s8 GEMM can saturate; 7-bit weights (reduce_range) avoid the accuracy loss
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False, reduce_range=True)
+        ORTQuantizer.from_pretrained(ort_model).quantize(save_dir=model_dir, quantization_config=qconfig)
+        AutoTokenizer.from_pretrained(NER_MODEL_NAME).save_pretrained(model_dir)
+
+    model = ORTModelForTokenClassification.from_pretrained(model_dir, file_name="model_quantized.onnx")
+    return pipeline("ner", model=model, tokenizer=AutoTokenizer.from_pretrained(model_dir))
+
+
+@functools.lru_cache(maxsize=1)
+def get_ner():
+    """Return the shared NER pipeline (FP16 on GPU, int8 ONNX Runtime on CPU)."""
+    if use_cuda:
+        return pipeline("ner", model=NER_MODEL_NAME, device=0, torch_dtype=torch.float16)
+    return load_quantized_ner()
 
-# Semantic Model for fuzzy matching when SQL lookup fails
-semantic_model = SentenceTransformer("all-MiniLM-L6-v2")
+
+# Semantic Model for fuzzy matching when SQL lookup fails: a model2vec-distilled static
+# embedding (token lookup + mean pooling, no transformer forward pass per encode)
+SEMANTIC_MODEL_NAME = "minishlab/potion-base-8M"
+
+
+def _usable_cpu_count():
+    """CPUs this process may run on (respects affinity), or None if unknown."""
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count()
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_semantic():
+    """Return the shared semantic embedding model."""
+    n_cpus = _usable_cpu_count()
+    if not use_cuda and n_cpus:
+        torch.set_num_threads(n_cpus)  # let MKL use every usable core for CPU matmuls
+    semantic_model = SentenceTransformer(modules=[StaticEmbedding.from_model2vec(SEMANTIC_MODEL_NAME)],
+                                         device=device)
+    if use_cuda:
+        semantic_model.half()
+    return semantic_model
 
 # ==================================================================================
 # Step 1: Extract Tables using ColPali (Optimized Table Extraction)
 # ==================================================================================
-def extract_tables(pdf_path):
-    """Extract tables using ColPali for structured parsing."""
-    tables = colpali.extract_tables(pdf_path, method="auto")  # Automatically detects table structure
-    return [pd.DataFrame(table) for table in tables]
+def _extract_page_tables(args):
+    """Extract the tables of a single PDF page with pdfplumber (runs in a worker process)."""
+    pdf_path, page_number = args
+    with pdfplumber.open(pdf_path) as pdf:
+        return pdf.pages[page_number].extract_tables()
+
+
+def rows_to_arrow(rows):
+    """Build an Arrow table with string columns col_0..col_n from a list of extracted rows."""
+    width = max((len(row) for row in rows), default=0)
+    columns = [[None if j >= len(row) or row[j] is None else str(row[j]) for row in rows] for j in range(width)]
+    return pa.table({f"col_{j}": pa.array(column, type=pa.string()) for j, column in enumerate(columns)})
+
+
+def extract_tables(pdf_path, engine="colpali"):
+    """Extract tables using ColPali for structured parsing, as Arrow tables.
+
+    engine="pdfplumber" extracts pages in parallel across CPU cores instead;
+    each worker opens the PDF and parses one page.
+    """
+    if engine == "pdfplumber":
+        with pdfplumber.open(pdf_path) as pdf:
+            n_pages = len(pdf.pages)
+        with ProcessPoolExecutor() as executor:
+            page_tables = executor.map(_extract_page_tables, [(pdf_path, i) for i in range(n_pages)])
+            tables = [table for page in page_tables for table in page]
+    else:
+        tables = colpali.extract_tables(pdf_path, method="auto")  # Automatically detects table structure
+    return [rows_to_arrow(table) for table in tables]
 
 # ==================================================================================
 # Step 2: Store Data in DuckDB (for Structured Queries)
 # ==================================================================================
+def table_row_texts(table):
+    """Join every row of an Arrow table into one space-separated string (vectorized, no per-row loop)."""
+    if table.num_columns == 0:
+        return [""] * table.num_rows
+    texts = pc.binary_join_element_wise(*table.columns, " ", null_handling="replace", null_replacement="")
+    return texts.to_pylist()
+
+
 def store_in_duckdb(tables):
-    """Store extracted tables in DuckDB for fast SQL lookups."""
+    """Store extracted tables in DuckDB for fast SQL lookups.
+
+    Each row's space-joined text is computed once here, stored in a _row_text
+    column for SQL fuzzy matching and returned as table_texts for the
+    semantic search index. table_columns maps each stored table to its data
+    columns, so queries never have to ask the catalog.
+    """
     con = duckdb.connect(":memory:")
     table_references = []
+    table_texts = []
+    table_columns = {}
 
-    for i, table in enumerate(tables):
-        table.columns = [f"col_{j}" for j in range(len(table.columns))]
+    for table in tables:
+        if table.num_columns == 0:
+            continue  # DuckDB cannot create a table without columns
+        # Number stored tables contiguously so table_0 is always the first stored table
+        i = len(table_references)
         table_name = f"table_{i}"
-        con.execute(f"CREATE TABLE {table_name} AS SELECT * FROM table", {"table": table})
+        row_texts = table_row_texts(table)
+        table = table.append_column("_row_text", pa.array(row_texts, type=pa.string()))
+        # Register the Arrow table as a view (zero-copy scan) and materialize it as a table
+        con.register(f"t{i}", table)
+        con.execute(f"CREATE TABLE {table_name} AS SELECT * FROM t{i}")
+        con.unregister(f"t{i}")
+        # ART index on the lookup column turns the col_0 point query into an index probe
+        con.execute(f"CREATE INDEX idx_{table_name}_col0 ON {table_name}(col_0)")
         table_references.append(table_name)
+        table_texts.extend(row_texts)
+        table_columns[table_name] = table.column_names[:-1]  # without _row_text
+
+    return con, table_references, table_texts, table_columns
+
+# ==================================================================================
+# Step 2.5: Build Semantic Corpus Index (Embeddings computed once, not per query)
+# ==================================================================================
+@dataclass
+class CorpusIndex:
+    """Row texts of all tables and the index over their embeddings.
+
+    Exactly one of ann_index (FAISS index) or table_embeddings
+    (normalized embedding matrix for exact search) is set, or neither when
+    the corpus is empty.
+    """
+    table_texts: list
+    ann_index: faiss.Index = None
+    table_embeddings: torch.Tensor = None
+
+    def best_match(self, query_embedding):
+        """Return the row text most similar to a normalized query embedding tensor, or None."""
+        if not self.table_texts:
+            return None
+        if self.table_embeddings is not None:
+            # Embeddings are pre-normalized, so cosine similarity is a single matmul + argmax
+            query_embedding = query_embedding.to(self.table_embeddings.device, self.table_embeddings.dtype)
+            best_match_idx = (self.table_embeddings @ query_embedding).argmax().item()
+        else:
+            query_vector = query_embedding.float().cpu().numpy().reshape(1, -1)
+            _, best_match_ids = self.ann_index.search(query_vector, 1)
+            best_match_idx = int(best_match_ids[0][0])
+            if best_match_idx == -1:
+                return None  # FAISS found no candidate (e.g. every probed IVF list was empty)
+        return self.table_texts[best_match_idx]
+
+
+def build_ann_index(embeddings, method="hnsw"):
+    """Build a FAISS inner-product index (cosine on normalized embeddings).
+
+    "hnsw" builds a graph index over int8 scalar-quantized vectors (~O(log N) search);
+    "ivf" builds an inverted-file index with nlist = max(2*sqrt(N), 20) clusters over
+    int8 vectors; "pq" stores product-quantization codes of up to 48 bytes, one byte per
+    sub-quantizer, with the count chosen to divide dim (needs >= 256 rows);
+    "flat" is an unquantized brute-force index, meant to be moved to the GPU.
+    """
+    vectors = embeddings.cpu().numpy().astype("float32")
+    dim = vectors.shape[1]
+
+    if method == "flat":
+        index = faiss.IndexFlatIP(dim)
+    elif method in ("ivf", "pq"):
+        nlist = min(max(int(2 * math.sqrt(len(vectors))), 20), len(vectors))
+        quantizer = faiss.IndexFlatIP(dim)
+        if method == "pq":
+            # FAISS requires dim % M == 0: take the largest divisor of dim that is <= 48
+            n_subquantizers = max(m for m in range(1, 49) if dim % m == 0)
+            index = faiss.IndexIVFPQ(quantizer, dim, nlist, n_subquantizers, 8, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexIVFScalarQuantizer(quantizer, dim, nlist, faiss.ScalarQuantizer.QT_8bit,
+                                                  faiss.METRIC_INNER_PRODUCT)
+        index.nprobe = 10
+    else:
+        index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = 100
+
+    index.train(vectors)
+    index.add(vectors)
+    return index
 
-    return con, table_references
+
+@functools.lru_cache(maxsize=1)
+def _faiss_gpu_resources():
+    """FAISS GPU scratch memory, shared by all GPU indexes (must outlive them)."""
+    return faiss.StandardGpuResources()
+
+
+def faiss_gpu_available():
+    """True when CUDA is present and the installed FAISS build can use the GPU."""
+    return use_cuda and hasattr(faiss, "StandardGpuResources")
+
+
+def place_ann_index(index, method):
+    """Move a flat index to GPU 0 when FAISS can use the GPU."""
+    if method == "flat" and faiss_gpu_available():
+        return faiss.index_cpu_to_gpu(_faiss_gpu_resources(), 0, index)
+    return index
+
+
+def build_corpus_index(table_texts, cache_path=None, method=None):
+    """Encode the row texts from store_in_duckdb once for semantic search.
+
+    method "exact" keeps the normalized embeddings on the GPU (or CPU) for an
+    exact matmul search; any other method is passed to build_ann_index and only
+    the quantized index is kept. By default a flat FAISS index is searched on the
+    GPU when FAISS can use it, and an HNSW index is used otherwise. If cache_path
+    points to a previously saved index it is loaded instead of re-encoding the
+    corpus; otherwise the fresh index is saved there.
+    """
+    method = method or ("flat" if faiss_gpu_available() else "hnsw")
+
+    if not table_texts:
+        return CorpusIndex([])  # nothing was stored: no index to build or cache
+
+    if cache_path and os.path.exists(cache_path):
+        # The cache holds only tensors, strings and lists, so it loads without unpickling code
+        try:
+            cached = torch.load(cache_path, weights_only=True)
+        except pickle.UnpicklingError:
+            cached = {}  # written by an older version (or tampered with): rebuild it
+        if (cached.get("table_texts") == table_texts and cached.get("method") == method
+                and cached.get("model") == SEMANTIC_MODEL_NAME):
+            if method == "exact":
+                return CorpusIndex(table_texts, table_embeddings=cached["table_embeddings"].to(device))
+            ann_index = faiss.deserialize_index(cached["ann_index"].numpy())
+            return CorpusIndex(table_texts, place_ann_index(ann_index, method))
+
+    with torch.inference_mode():
+        table_embeddings = get_semantic().encode(table_texts, batch_size=1024, show_progress_bar=False,
+                                                 convert_to_tensor=True, normalize_embeddings=True)
+
+    if method == "exact":
+        corpus_index = CorpusIndex(table_texts, table_embeddings=table_embeddings.contiguous())
+        cached_index = {"table_embeddings": table_embeddings.cpu()}
+    else:
+        ann_index = build_ann_index(table_embeddings, method)
+        corpus_index = CorpusIndex(table_texts, place_ann_index(ann_index, method))
+        # CPU copy (GPU indexes can't serialize), stored as a uint8 tensor
+        cached_index = {"ann_index": torch.from_numpy(faiss.serialize_index(ann_index))}
+
+    if cache_path:
+        torch.save({"table_texts": table_texts, "method": method, "model": SEMANTIC_MODEL_NAME,
+                    **cached_index}, cache_path)
+
+    return corpus_index
 
 # ==================================================================================
 # Step 3: Store Data in GraphDB (for Relationship Queries)
 # ==================================================================================
+# Connection settings for the drivers from get_graph_db / open_async_graph_driver
+NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://localhost:7687")
+NEO4J_USER = os.environ.get("NEO4J_USER", "neo4j")
+NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD", "password")
+
+MATERIAL_QUALIFICATION_QUERY = "MATCH (m:Material {name: $name}) RETURN m.qualification AS qualification"
+
+
 class GraphDB:
     """Handles GraphDB interactions for material relationships."""
-    def __init__(self, uri, user, password):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+    def __init__(self, uri, user, password, max_connection_pool_size=64, connection_acquisition_timeout=30):
+        # execute_query() borrows sessions from the driver's connection pool
+        self.driver = GraphDatabase.driver(uri, auth=(user, password),
+                                           max_connection_pool_size=max_connection_pool_size,
+                                           connection_acquisition_timeout=connection_acquisition_timeout)
+        # Per-instance cache, so entries (and self) are not shared across GraphDB objects
+        self.query_material = functools.lru_cache(maxsize=10_000)(self._query_material)
+        # Bumped on every write; answer caches key on it so stale answers are never served
+        self.write_version = 0
+        # Databases written by the old CREATE-based add_material can hold duplicate names,
+        # which would make the unique constraint fail: keep one node per name first
+        self.driver.execute_query("MATCH (m:Material) WHERE m.name IS NOT NULL "
+                                  "WITH m.name AS name, collect(m) AS nodes WHERE size(nodes) > 1 "
+                                  "UNWIND tail(nodes) AS extra DETACH DELETE extra")
+        # Unique constraint backs MERGE on Material.name with an index
+        self.driver.execute_query("CREATE CONSTRAINT material_name IF NOT EXISTS "
+                                  "FOR (m:Material) REQUIRE m.name IS UNIQUE")
 
     def close(self):
         self.driver.close()
 
     def add_material(self, name, qualification):
         """Store material and its qualification in GraphDB."""
-        with self.driver.session() as session:
-            session.run("CREATE (m:Material {name: $name, qualification: $qualification})",
-                        name=name, qualification=qualification)
+        self.add_materials([{"name": name, "qualification": qualification}])
 
-    def query_material(self, name):
-        """Retrieve qualification of a material from GraphDB."""
-        with self.driver.session() as session:
-            result = session.run("MATCH (m:Material {name: $name}) RETURN m.qualification", name=name)
-            return result.single()[0] if result.single() else None
+    def add_materials(self, rows):
+        """Upsert many materials in one transaction; rows are dicts with name and qualification."""
+        self.driver.execute_query("UNWIND $rows AS r MERGE (m:Material {name: r.name}) "
+                                  "SET m.qualification = r.qualification",
+                                  rows=rows)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop cached lookups and answers that may be stale after a write."""
+        self.query_material.cache_clear()
+        self.write_version += 1
+
+    def _query_material(self, name):
+        """Retrieve qualification of a material from GraphDB (cached as query_material)."""
+        record = self.driver.execute_query(MATERIAL_QUALIFICATION_QUERY, name=name,
+                                           result_transformer_=Result.single)
+        return record["qualification"] if record else None
+
+
+@functools.lru_cache(maxsize=1)
+def get_graph_db():
+    """Return the process-wide GraphDB, opening its pooled driver on first use."""
+    return GraphDB(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD, max_connection_pool_size=50)
+
+
+def open_async_graph_driver():
+    """Open an async Neo4j driver owned by the caller.
+
+    Async drivers and their pooled connections belong to the event loop they
+    were created on, so open one per loop and close it there, e.g.
+    ``async with open_async_graph_driver() as driver: ...``.
+    """
+    return AsyncGraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD), max_connection_pool_size=50)
+
+
+async def query_material_async(driver, name):
+    """Retrieve qualification of a material from GraphDB without blocking the event loop."""
+    record = await driver.execute_query(MATERIAL_QUALIFICATION_QUERY, name=name,
+                                        result_transformer_=AsyncResult.single)
+    return record["qualification"] if record else None
 
 # ==================================================================================
 # Step 4: Query Understanding (NER for Extracting Material Names)
 # ==================================================================================
+@functools.lru_cache(maxsize=4096)
 def extract_query_entities(query):
-    """Extract key entities (like material names) using NER."""
-    entities = ner_pipeline(query)
-    return [ent["word"] for ent in entities if ent["entity"] in ["B-MISC", "I-MISC", "B-ORG", "I-ORG"]]
+    """Extract key entities (like material names) using NER, cached per query string."""
+    entities = get_ner()(query)
+    return tuple(ent["word"] for ent in entities if ent["entity"] in ["B-MISC", "I-MISC", "B-ORG", "I-ORG"])
 
 # ==================================================================================
 # Step 5: Query Execution (GraphDB → SQL → Semantic Search)
 # ==================================================================================
-def query_system(query, db_con, graph_db, tables):
-    """Process query using GraphDB, SQL, and Semantic Search as fallback."""
+def query_system(query, db_con, graph_db, corpus_index, table_columns):
+    """Process query using GraphDB, SQL, and Semantic Search as fallback.
+
+    table_columns is the mapping returned by store_in_duckdb.
+    """
 
     # Step 5.1: Extract material name from query
     entities = extract_query_entities(query)
@@ -92,39 +415,73 @@ def query_system(query, db_con, graph_db, tables):
     if qualification:
         return f"The qualification of {material_name} is {qualification}."
 
-    # Step 5.3: SQL Lookup in DuckDB
-    sql_query = f"SELECT * FROM table_0 WHERE col_0 = '{material_name}'"
-    result = db_con.execute(sql_query).fetchall()
-    if result:
-        return result[0][1]  # Returning qualification from structured data
+    # Step 5.3: SQL Lookup in DuckDB (qualification is col_1 of table_0, if it has one)
+    if "col_1" in table_columns.get("table_0", ()):
+        result = db_con.execute("SELECT col_1 FROM table_0 WHERE col_0 = ?", [material_name]).fetchone()
+        if result:
+            return result[0]  # Returning qualification from structured data
+
+    # Step 5.3b: Cheap SQL fuzzy match on the precomputed row text of every table
+    # (plain substring, no wildcards)
+    if material_name and table_columns:
+        sql_query = " UNION ALL ".join(f"SELECT _row_text FROM {table_name} WHERE contains(lower(_row_text), lower($1))"
+                                       for table_name in table_columns)
+        result = db_con.execute(f"{sql_query} LIMIT 1", [material_name]).fetchone()
+        if result:
+            return f"Closest match: {result[0]}"
 
     # Step 5.4: If SQL fails, use Semantic Search
-    query_embedding = semantic_model.encode(query, convert_to_tensor=True)
-    table_texts = [" ".join(map(str, row)) for table in tables for _, row in table.iterrows()]
-    table_embeddings = semantic_model.encode(table_texts, convert_to_tensor=True)
-    
-    similarity_scores = util.pytorch_cos_sim(query_embedding, table_embeddings)
-    best_match_idx = similarity_scores.argmax().item()
-    best_match_text = table_texts[best_match_idx]
+    if not corpus_index.table_texts:
+        return "No match found."
+    with torch.inference_mode():
+        query_embedding = get_semantic().encode(query, convert_to_tensor=True, normalize_embeddings=True)
+    best_match_text = corpus_index.best_match(query_embedding)
+    if best_match_text is None:
+        return "No match found."
 
     return f"Closest match: {best_match_text}"
 
+
+class QueryEngine:
+    """Runs query_system against one set of stores, caching answers per normalized query.
+
+    The cache belongs to the engine, so dropping the engine releases the stores.
+    Queries are whitespace-normalized but keep their case, because the NER
+    model is cased.
+    """
+    def __init__(self, db_con, graph_db, corpus_index, table_columns):
+        self.db_con = db_con
+        self.graph_db = graph_db
+        self.corpus_index = corpus_index
+        self.table_columns = table_columns
+        self._answer_cached = functools.lru_cache(maxsize=10_000)(self._answer)
+
+    def _answer(self, query, graph_write_version):
+        """Answer a normalized query; graph_write_version only keys the cache."""
+        return query_system(query, self.db_con, self.graph_db, self.corpus_index, self.table_columns)
+
+    def query(self, query):
+        """Answer a query, reusing the cached answer for a repeat query."""
+        return self._answer_cached(" ".join(query.split()), self.graph_db.write_version)
+
 # ==================================================================================
 # Example Usage
 # ==================================================================================
-pdf_path = "materials.pdf"
+if __name__ == "__main__":
+    pdf_path = "materials.pdf"
 
-# Step 1: Extract tables using ColPali
-tables = extract_tables(pdf_path)
+    # Step 1: Extract tables using ColPali
+    tables = extract_tables(pdf_path)
 
-# Step 2: Store in DuckDB
-db_con, table_references = store_in_duckdb(tables)
+    # Step 2: Store in DuckDB and build the semantic search index
+    db_con, table_references, table_texts, table_columns = store_in_duckdb(tables)
+    corpus_index = build_corpus_index(table_texts, cache_path="corpus_index.pt")
 
-# Step 3: Initialize GraphDB and store sample data
-graph_db = GraphDB("bolt://localhost:7687", "neo4j", "password")
-graph_db.add_material("Titanium Alloy", "Grade 5")
+    # Step 3: Initialize GraphDB and store sample data
+    graph_db = get_graph_db()
+    graph_db.add_material("Titanium Alloy", "Grade 5")
 
-# Step 4: Query the system
-query = "What is the qualification of Titanium Alloy?"
-answer = query_system(query, db_con, graph_db, tables)
-print(answer)  # Returns the best match from SQL or Semantic Search
+    # Step 4: Query the system
+    query = "What is the qualification of Titanium Alloy?"
+    answer = QueryEngine(db_con, graph_db, corpus_index, table_columns).query(query)
+    print(answer)  # Returns the best match from SQL or Semantic Search